@@ -1,6 +1,14 @@
 #324095702
-from abcvoting.preferences import Profile
+from economic_algorithms.instrumentation import count, instrumented, phase
 
+def _log(message):
+    """
+    Prints one step of the Equal Shares run (timed as its own phase).
+    """
+    with phase("custom_equal_shares_verbose.print"):
+        print(message)
+
+@instrumented
 def custom_equal_shares_verbose(profile, k):
     """
     Implements the Equal Shares method, printing all internal steps.
@@ -17,54 +25,57 @@ def custom_equal_shares_verbose(profile, k):
     committee = set()
     candidates = set(range(profile.num_cand))
 
-    print(f"\n=== Running Equal Shares for k={k} ===")
-    print(f"Initial budgets per voter: {[round(b, 3) for b in budget]}")
+    _log(f"\n=== Running Equal Shares for k={k} ===")
+    _log(f"Initial budgets per voter: {[round(b, 3) for b in budget]}")
 
     round_num = 1
 
     while len(committee) < k:
-        print(f"\n--- Round {round_num} ---")
+        _log(f"\n--- Round {round_num} ---")
+        count("custom_equal_shares_verbose.rounds")
         viable = []
 
-        # Check each candidate not yet in the committee
-        for c in sorted(candidates - committee):
-            supporters = [i for i, ballot in enumerate(profile) if c in ballot.approved]
-            if not supporters:
-                print(f"Candidate {c} has no supporters → skipped.")
-                continue
-
-            cost_per_voter = 1.0 / len(supporters)
-            total_budget = sum(budget[i] for i in supporters)
-
-            print(f"Checking candidate {c}: supported by voters {supporters}")
-            print(f"  • Needs {round(cost_per_voter, 3)} per supporter")
-            print(f"  • Total supporter budget available: {round(total_budget, 3)}")
-
-            # Check if all supporters can afford their share
-            if all(budget[i] >= cost_per_voter for i in supporters):
-                print(f"  ✅ Candidate {c} is affordable.")
-                viable.append((cost_per_voter, c, supporters))
-            else:
-                print(f"  ❌ Candidate {c} cannot be afforded.")
+        with phase("custom_equal_shares_verbose.evaluate_candidates"):
+            # Check each candidate not yet in the committee
+            for c in sorted(candidates - committee):
+                count("custom_equal_shares_verbose.candidates_evaluated")
+                supporters = [i for i, ballot in enumerate(profile) if c in ballot.approved]
+                if not supporters:
+                    _log(f"Candidate {c} has no supporters → skipped.")
+                    continue
+
+                cost_per_voter = 1.0 / len(supporters)
+                total_budget = sum(budget[i] for i in supporters)
+
+                _log(f"Checking candidate {c}: supported by voters {supporters}")
+                _log(f"  • Needs {round(cost_per_voter, 3)} per supporter")
+                _log(f"  • Total supporter budget available: {round(total_budget, 3)}")
+
+                # Check if all supporters can afford their share
+                if all(budget[i] >= cost_per_voter for i in supporters):
+                    _log(f"  ✅ Candidate {c} is affordable.")
+                    viable.append((cost_per_voter, c, supporters))
+                else:
+                    _log(f"  ❌ Candidate {c} cannot be afforded.")
 
         if not viable:
-            print("❌ No more viable candidates. Stopping.")
+            _log("❌ No more viable candidates. Stopping.")
             break
 
         # Select candidate with minimal cost (tie-breaking by index)
         cost, chosen_cand, supporters = min(viable)
-        print(f"\n✅ Selecting candidate {chosen_cand} (cost per supporter: {round(cost, 3)})")
+        _log(f"\n✅ Selecting candidate {chosen_cand} (cost per supporter: {round(cost, 3)})")
         committee.add(chosen_cand)
 
         # Deduct cost from supporters' budgets
         for i in supporters:
             budget[i] -= cost
 
-        print(f"Updated budgets after round {round_num}: {[round(b, 3) for b in budget]}")
+        _log(f"Updated budgets after round {round_num}: {[round(b, 3) for b in budget]}")
 
         round_num += 1
 
-    print(f"\nFinal committee for k={k}: {committee}")
+    _log(f"\nFinal committee for k={k}: {committee}")
     return committee
 
 def check_monotonicity(committee_k, committee_k1):
@@ -96,52 +107,54 @@ def prepare_profile(approval_sets):
     Returns:
         Profile: The constructed election profile.
     """
+    from abcvoting.preferences import Profile
+
     num_cand = max([cand for voter in approval_sets for cand in voter]) + 1
     profile = Profile(num_cand)
     for voter in approval_sets:
         profile.add_voter(voter)
     return profile
 
-# Example block (only one test case here, but you can add more if needed)
-examples = [
-    {
-        "name": "Example for Non-Monotonicity - section A ",
-        "approval_sets": [
-            [0, 1],  # Voter 0 approves candidates 0,1
-            [0, 1],  # Voter 1 approves candidates 0,1
-            [2, 3],  # Voter 2 approves candidates 2,3
-            [2, 3],  # Voter 3 approves candidates 2,3
-        ],
-        "num_winners_k": 2,
-    },
-
-    {
-        "name": "Non-monotonic Without Tie-Breaking - section B",
-        "approval_sets": [
-            [0],      # Voter 0 approves candidate 0
-            [1],      # Voter 1 approves candidate 1
-            [1, 2],   # Voter 2 approves candidates 1, 2
-            [3],      # Voter 3 approves candidate 3
-        ],
-        "num_winners_k": 2,
-    },
-]
-
-# Main loop over examples
-for example in examples:
-    print(f"\n\n===== Running {example['name']} =====")
-    k = example["num_winners_k"]
-    approval_sets = example["approval_sets"]
-    profile = prepare_profile(approval_sets)
-
-    # Run Equal Shares method for k
-    committee_k = custom_equal_shares_verbose(profile, k)
-
-    # Run Equal Shares method for k+1
-    committee_k1 = custom_equal_shares_verbose(profile, k + 1)
-
-    # Check monotonicity between k and k+1
-    if not check_monotonicity(committee_k, committee_k1):
-        print(f"⚠️ Found non-monotonicity in {example['name']} ")
-        print(f"------------------------------------------------------------------------------ ")
-       
+if __name__ == "__main__":
+    # Example block (only one test case here, but you can add more if needed)
+    examples = [
+        {
+            "name": "Example for Non-Monotonicity - section A ",
+            "approval_sets": [
+                [0, 1],  # Voter 0 approves candidates 0,1
+                [0, 1],  # Voter 1 approves candidates 0,1
+                [2, 3],  # Voter 2 approves candidates 2,3
+                [2, 3],  # Voter 3 approves candidates 2,3
+            ],
+            "num_winners_k": 2,
+        },
+
+        {
+            "name": "Non-monotonic Without Tie-Breaking - section B",
+            "approval_sets": [
+                [0],      # Voter 0 approves candidate 0
+                [1],      # Voter 1 approves candidate 1
+                [1, 2],   # Voter 2 approves candidates 1, 2
+                [3],      # Voter 3 approves candidate 3
+            ],
+            "num_winners_k": 2,
+        },
+    ]
+
+    # Main loop over examples
+    for example in examples:
+        print(f"\n\n===== Running {example['name']} =====")
+        k = example["num_winners_k"]
+        approval_sets = example["approval_sets"]
+        profile = prepare_profile(approval_sets)
+
+        # Run Equal Shares method for k
+        committee_k = custom_equal_shares_verbose(profile, k)
+
+        # Run Equal Shares method for k+1
+        committee_k1 = custom_equal_shares_verbose(profile, k + 1)
+
+        # Check monotonicity between k and k+1
+        if not check_monotonicity(committee_k, committee_k1):
+            print(f"⚠️ Found non-monotonicity in {example['name']} ")
+            print(f"------------------------------------------------------------------------------ ")
@@ -1,6 +1,7 @@
 #324095702
-import cvxpy as cp
+from economic_algorithms.instrumentation import count, instrumented, phase
 
+@instrumented
 def find_decomposition(budget, preferences):
     """
     Determines whether a given participatory budgeting allocation is decomposable (fair),
@@ -19,42 +20,47 @@ def find_decomposition(budget, preferences):
         list of list of float: A decomposition matrix of shape (n x m), where entry [i][j] is the amount agent i contributes to topic j,
                                or None if no valid decomposition exists.
     """
+    import cvxpy as cp
+
     n = len(preferences)  # number of agents
     m = len(budget)       # number of topics
     C = sum(budget)       # total budget
     share = C / n         # fair share per agent
 
-    # Create decision variables only for topics supported by each agent
-    d = [[None for _ in range(m)] for _ in range(n)]
-    for i in range(n):
-        for j in preferences[i]:
-            d[i][j] = cp.Variable(nonneg=True)  # only allow non-negative contributions
-
-    constraints = []
-
-    # Constraint 1: For each topic j, the total contributions should equal budget[j]
-    for j in range(m):
-        contributors = [d[i][j] for i in range(n) if d[i][j] is not None]
-        if contributors:
-            constraints.append(cp.sum(contributors) == budget[j])
-        else:
-            # Topic j is not supported by anyone, but has a non-zero budget
-            if budget[j] != 0:
-                return None
-
-    # Constraint 2: Each agent contributes exactly C/n across all supported topics
-    for i in range(n):
-        contributions = [d[i][j] for j in preferences[i]]
-        if contributions:
-            constraints.append(cp.sum(contributions) == share)
-        else:
-            # Agent supports no topics → must receive zero budget
-            if share != 0:
-                return None
+    with phase("find_decomposition.build_problem"):
+        # Create decision variables only for topics supported by each agent
+        d = [[None for _ in range(m)] for _ in range(n)]
+        for i in range(n):
+            for j in preferences[i]:
+                d[i][j] = cp.Variable(nonneg=True)  # only allow non-negative contributions
+
+        constraints = []
+
+        # Constraint 1: For each topic j, the total contributions should equal budget[j]
+        for j in range(m):
+            contributors = [d[i][j] for i in range(n) if d[i][j] is not None]
+            if contributors:
+                constraints.append(cp.sum(contributors) == budget[j])
+            else:
+                # Topic j is not supported by anyone, but has a non-zero budget
+                if budget[j] != 0:
+                    return None
+
+        # Constraint 2: Each agent contributes exactly C/n across all supported topics
+        for i in range(n):
+            contributions = [d[i][j] for j in preferences[i]]
+            if contributions:
+                constraints.append(cp.sum(contributions) == share)
+            else:
+                # Agent supports no topics → must receive zero budget
+                if share != 0:
+                    return None
 
     # Solve the feasibility problem (no objective function needed)
     prob = cp.Problem(cp.Minimize(0), constraints)
-    result = prob.solve()
+    with phase("find_decomposition.solve"):
+        result = prob.solve()
+    count("find_decomposition.solver_calls")
 
     if prob.status != cp.OPTIMAL:
         return None  # No valid decomposition found
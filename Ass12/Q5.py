@@ -1,7 +1,12 @@
+import bisect
+import math
 from typing import List
 import numpy as np
 
+from economic_algorithms.instrumentation import count, instrumented
+
 # ===== Part 5A - Generalized Median Mechanism with Binary Search =====
+@instrumented
 def compute_budget_binary(total_budget: float, citizen_votes: List[List[float]]) -> List[float]:
     """
     Computes a fair budget allocation using the Generalized Median Mechanism
@@ -39,6 +44,7 @@ def compute_budget_binary(total_budget: float, citizen_votes: List[List[float]])
     best_median = None
 
     while right - left > epsilon:
+        count("compute_budget_binary.iterations")
         mid = (left + right) / 2
         current_sum, current_median = total_from_t(mid)
         if current_sum > total_budget:
@@ -50,6 +56,7 @@ def compute_budget_binary(total_budget: float, citizen_votes: List[List[float]])
     return [float(x) for x in best_median]
 
 # ===== Part 5B - Direct Allocation Using t = 1/n (No Binary Search) =====
+@instrumented
 def compute_budget_direct(total_budget: float, citizen_votes: List[List[float]]) -> List[float]:
     """
     Computes a fair budget allocation using the Generalized Median Mechanism
@@ -79,6 +86,161 @@ def compute_budget_direct(total_budget: float, citizen_votes: List[List[float]])
 
     return medians
 
+# ===== Part 5C - Incremental Median Mechanism for Live Vote Streams =====
+class IncrementalMedianBudget:
+    """
+    Stateful version of compute_budget_binary for votes that arrive one at a time.
+
+    For every item the citizen amounts are kept in a sorted list (bisect insertion),
+    so the median of the item column (citizens + n-1 fixed votes) is found by a
+    binary search over the two sorted sequences instead of a full np.median.
+    One evaluation of the total for a given t costs O(m log n).
+
+    The parameter t is cached between queries: after a vote changes, the search
+    starts from the previous t and gallops outwards until it brackets the new
+    solution, then bisects down to the same epsilon used by compute_budget_binary.
+
+    Args:
+    - total_budget: The total amount of money to be allocated.
+    - num_items: The number of budget items (length of every vote).
+    """
+
+    epsilon = 1e-5
+
+    def __init__(self, total_budget: float, num_items: int):
+        self.total_budget = total_budget
+        self.num_items = num_items
+        self.votes = {}
+        self.columns = [[] for _ in range(num_items)]
+        self.t = None
+
+    def __len__(self):
+        return len(self.votes)
+
+    def _checked_vote(self, vote):
+        # Raises (TypeError / ValueError) before any state is touched.
+        # NaN would break the sorted order of the columns, so only finite amounts >= 0 are allowed.
+        if len(vote) != self.num_items:
+            raise ValueError(f"Expected a vote over {self.num_items} items, got {len(vote)}.")
+        vote = [float(x) for x in vote]
+        if not all(math.isfinite(x) and x >= 0 for x in vote):
+            raise ValueError(f"Vote amounts must be finite and non-negative, got {vote}.")
+        return vote
+
+    def _insert(self, voter_id, vote):
+        self.votes[voter_id] = vote
+        for column, x in zip(self.columns, vote):
+            bisect.insort(column, x)
+
+    def add_vote(self, voter_id, vote: List[float]):
+        """
+        Adds the ideal allocation of a new citizen.
+        """
+        if voter_id in self.votes:
+            raise ValueError(f"Voter {voter_id!r} already voted, use replace_vote instead.")
+        self._insert(voter_id, self._checked_vote(vote))
+
+    def remove_vote(self, voter_id):
+        """
+        Removes the vote of a citizen and returns it.
+        """
+        if voter_id not in self.votes:
+            raise KeyError(voter_id)
+        vote = self.votes.pop(voter_id)
+        for column, x in zip(self.columns, vote):
+            del column[bisect.bisect_left(column, x)]
+        return vote
+
+    def replace_vote(self, voter_id, vote: List[float]):
+        """
+        Replaces the vote of an existing citizen and returns the old vote.
+        """
+        vote = self._checked_vote(vote)
+        old_vote = self.remove_vote(voter_id)
+        self._insert(voter_id, vote)
+        return old_vote
+
+    def _fixed_vote(self, i, t):
+        return self.total_budget * min(1, (i + 1) * t)
+
+    def _column_median(self, column, t):
+        # The median of the 2n-1 combined votes is the n-th smallest one.
+        # Binary search on j, the number of fixed votes among the n smallest.
+        n = len(column)
+        k = n
+        lo, hi = 0, n - 1
+        while True:
+            j = (lo + hi) // 2
+            i = k - j
+            if i > 0 and j < n - 1 and column[i - 1] > self._fixed_vote(j, t):
+                lo = j + 1
+            elif j > 0 and i < n and self._fixed_vote(j - 1, t) > column[i]:
+                hi = j - 1
+            else:
+                candidates = []
+                if i > 0:
+                    candidates.append(column[i - 1])
+                if j > 0:
+                    candidates.append(self._fixed_vote(j - 1, t))
+                return max(candidates)
+
+    def _total_from_t(self, t):
+        count("IncrementalMedianBudget.t_evaluations")
+        med = [self._column_median(column, t) for column in self.columns]
+        return sum(med), med
+
+    @instrumented
+    def allocation(self) -> List[float]:
+        """
+        Returns the current allocation per item, re-solving t from its previous value.
+        """
+        if not self.votes:
+            return [0.0] * self.num_items
+
+        t = self.t if self.t is not None else 1 / len(self.votes)
+        current_sum, current_median = self._total_from_t(t)
+
+        # Gallop from the previous t until the solution is bracketed by [left, right]
+        step = self.epsilon
+        if current_sum > self.total_budget:
+            right = t
+            left, best_median = None, None
+            while left is None:
+                t = max(0.0, right - step)
+                current_sum, current_median = self._total_from_t(t)
+                if current_sum <= self.total_budget or t == 0.0:
+                    left, best_median = t, current_median
+                else:
+                    right = t
+                    step *= 2
+        else:
+            left, best_median = t, current_median
+            right = None
+            while right is None:
+                if left == 1.0:
+                    right = left
+                    break
+                t = min(1.0, left + step)
+                current_sum, current_median = self._total_from_t(t)
+                if current_sum > self.total_budget:
+                    right = t
+                else:
+                    left, best_median = t, current_median
+                    step *= 2
+
+        # Same bisection as compute_budget_binary, on the (much smaller) bracket
+        while right - left > self.epsilon:
+            mid = (left + right) / 2
+            current_sum, current_median = self._total_from_t(mid)
+            if current_sum > self.total_budget:
+                right = mid
+            else:
+                left = mid
+                best_median = current_median
+
+        self.t = left
+        return [float(x) for x in best_median]
+
 # ===== Example Runs for Both Versions =====
 if __name__ == "__main__":
     total_budget = 100
@@ -95,3 +257,14 @@ if __name__ == "__main__":
         direct_result = compute_budget_direct(total_budget, votes)
         print("  Binary search result:", binary_result)
         print("  Direct method result:", direct_result)
+
+    # Live stream: votes arrive (and change) one at a time
+    print("\nIncremental stream (Example 4 votes):")
+    live = IncrementalMedianBudget(total_budget, 3)
+    for voter_id, vote in enumerate(examples["Example 4"]):
+        live.add_vote(voter_id, vote)
+        print(f"  after vote {voter_id}:", live.allocation())
+    live.replace_vote(0, [0, 0, 100])
+    print("  after voter 0 changes vote:", live.allocation())
+    live.remove_vote(1)
+    print("  after voter 1 leaves:", live.allocation())
@@ -1,6 +1,8 @@
-import cvxpy as cp
 import numpy as np
 
+from economic_algorithms.instrumentation import count, instrumented, phase
+
+@instrumented
 def egalitarian_allocation(value_matrix):
     """
     Solves the egalitarian resource allocation problem.
@@ -18,79 +20,89 @@ def egalitarian_allocation(value_matrix):
 
     Output:
     -------
-    Prints the allocation for each agent, i.e., how much of each resource they receive.
+    Prints the allocation for each agent, i.e., how much of each resource they receive,
+    and returns it as a NumPy array where X[i][j] is the fraction of resource j given to agent i.
     """
+    import cvxpy as cp  # loaded here so that importing this module stays cheap
 
     # Display input matrix
-    print("Input value matrix:")
-    for i, row in enumerate(value_matrix):
-        print(f"Agent #{i+1}: {row}")
-    print("\nSolving egalitarian allocation...\n")
+    with phase("egalitarian_allocation.print"):
+        print("Input value matrix:")
+        for i, row in enumerate(value_matrix):
+            print(f"Agent #{i+1}: {row}")
+        print("\nSolving egalitarian allocation...\n")
 
     # Convert input to NumPy array
     value_matrix = np.array(value_matrix)
     n_agents, n_resources = value_matrix.shape
 
-    # X[i][j] represents the fraction of resource j given to agent i
-    X = cp.Variable((n_agents, n_resources))
+    with phase("egalitarian_allocation.build_problem"):
+        # X[i][j] represents the fraction of resource j given to agent i
+        X = cp.Variable((n_agents, n_resources))
 
-    # z represents the minimum utility received by any agent
-    z = cp.Variable()
+        # z represents the minimum utility received by any agent
+        z = cp.Variable()
 
-    # Constraints list
-    constraints = []
+        # Constraints list
+        constraints = []
 
-    # Each agent must get at least z utility
-    for i in range(n_agents):
-        constraints.append(value_matrix[i] @ X[i, :] >= z)
+        # Each agent must get at least z utility
+        for i in range(n_agents):
+            constraints.append(value_matrix[i] @ X[i, :] >= z)
 
-    # Each resource must be fully allocated
-    for j in range(n_resources):
-        constraints.append(cp.sum(X[:, j]) == 1)
+        # Each resource must be fully allocated
+        for j in range(n_resources):
+            constraints.append(cp.sum(X[:, j]) == 1)
 
-    # No negative allocations
-    constraints.append(X >= 0)
+        # No negative allocations
+        constraints.append(X >= 0)
 
-    # Optimization goal: maximize the minimum value z
-    objective = cp.Maximize(z)
-    problem = cp.Problem(objective, constraints)
+        # Optimization goal: maximize the minimum value z
+        objective = cp.Maximize(z)
+        problem = cp.Problem(objective, constraints)
 
-    # Solve the problem
-    problem.solve()
+    # Solve the problem (cvxpy canonicalization + solver)
+    with phase("egalitarian_allocation.solve"):
+        problem.solve()
+    count("egalitarian_allocation.solver_calls")
 
     # Output results
-    print("Allocation result:")
-    for i in range(n_agents):
-        parts = []
-        for j in range(n_resources):
-            portion = X.value[i, j]
-            parts.append(f"{portion:.2f} of resource #{j+1}")
-        print(f"Agent #{i+1} gets " + ", ".join(parts) + ".")
-    print("\n" + "="*60 + "\n")
+    with phase("egalitarian_allocation.print"):
+        print("Allocation result:")
+        for i in range(n_agents):
+            parts = []
+            for j in range(n_resources):
+                portion = X.value[i, j]
+                parts.append(f"{portion:.2f} of resource #{j+1}")
+            print(f"Agent #{i+1} gets " + ", ".join(parts) + ".")
+        print("\n" + "="*60 + "\n")
+
+    return X.value
 
 
 # -------------------------------
 # Example Runs
 # -------------------------------
 
-# Example 1: from the assignment
-example_1 = [
-    [81, 19, 1],
-    [70, 1, 29]
-]
-egalitarian_allocation(example_1)
-
-# Example 2: three agents, two resources
-example_2 = [
-    [10, 90],
-    [40, 60],
-    [80, 20]
-]
-egalitarian_allocation(example_2)
-
-# Example 3: two agents, four resources
-example_3 = [
-    [1, 2, 3, 4],
-    [4, 3, 2, 1]
-]
-egalitarian_allocation(example_3)
+if __name__ == "__main__":
+    # Example 1: from the assignment
+    example_1 = [
+        [81, 19, 1],
+        [70, 1, 29]
+    ]
+    egalitarian_allocation(example_1)
+
+    # Example 2: three agents, two resources
+    example_2 = [
+        [10, 90],
+        [40, 60],
+        [80, 20]
+    ]
+    egalitarian_allocation(example_2)
+
+    # Example 3: two agents, four resources
+    example_3 = [
+        [1, 2, 3, 4],
+        [4, 3, 2, 1]
+    ]
+    egalitarian_allocation(example_3)
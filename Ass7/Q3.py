@@ -2,6 +2,9 @@
 import math
 from math import inf
 
+from economic_algorithms.instrumentation import count, instrumented, phase
+
+@instrumented
 def find_max_Avg_cycle(n, graph):
     """
     Finds the cycle with the maximum average (mean) weight in a directed graph.
@@ -13,54 +16,59 @@ def find_max_Avg_cycle(n, graph):
     eps = 1e-6
 
     # Convert adjacency matrix to edge list
-    edges = []
-    for u in range(n):
-        for v in range(n):
-            w = graph[u][v]
-            if w != -math.inf:
-                edges.append((u, v, w))
+    with phase("find_max_Avg_cycle.edge_list"):
+        edges = []
+        for u in range(n):
+            for v in range(n):
+                w = graph[u][v]
+                if w != -math.inf:
+                    edges.append((u, v, w))
+    count("find_max_Avg_cycle.edges", len(edges))
 
     # Karp's DP
-    dp = [[-inf] * n for _ in range(n + 1)]
-    for v in range(n):
-        dp[0][v] = 0.0
+    with phase("find_max_Avg_cycle.karp_dp"):
+        dp = [[-inf] * n for _ in range(n + 1)]
+        for v in range(n):
+            dp[0][v] = 0.0
+
+        incoming = [[] for _ in range(n)]
+        for u, v, w in edges:
+            incoming[v].append((u, w))
 
-    incoming = [[] for _ in range(n)]
-    for u, v, w in edges:
-        incoming[v].append((u, w))
+        for k in range(1, n + 1):
+            for v in range(n):
+                best = -inf
+                for u, w in incoming[v]:
+                    best = max(best, dp[k - 1][u] + w)
+                dp[k][v] = best
 
-    for k in range(1, n + 1):
+        # Compute max AVG weight
+        max_mean_weight = -inf
         for v in range(n):
-            best = -inf
-            for u, w in incoming[v]:
-                best = max(best, dp[k - 1][u] + w)
-            dp[k][v] = best
-
-    # Compute max AVG weight
-    max_mean_weight = -inf
-    for v in range(n):
-        min_avg = inf
-        for k in range(n):
-            if dp[n][v] > -inf and dp[k][v] > -inf:
-                avg = (dp[n][v] - dp[k][v]) / (n - k)
-                min_avg = min(min_avg, avg)
-        max_mean_weight = max(max_mean_weight, min_avg)
+            min_avg = inf
+            for k in range(n):
+                if dp[n][v] > -inf and dp[k][v] > -inf:
+                    avg = (dp[n][v] - dp[k][v]) / (n - k)
+                    min_avg = min(min_avg, avg)
+            max_mean_weight = max(max_mean_weight, min_avg)
 
     # Adjusted weights for Bellman-Ford
-    adjusted_edges = [(u, v, w - max_mean_weight + eps) for (u, v, w) in edges]
-    dist = [0.0] * n
-    parent = [-1] * n
-    x = -1
-
-    for _ in range(n):
+    with phase("find_max_Avg_cycle.bellman_ford"):
+        adjusted_edges = [(u, v, w - max_mean_weight + eps) for (u, v, w) in edges]
+        dist = [0.0] * n
+        parent = [-1] * n
         x = -1
-        for u, v, w in adjusted_edges:
-            if dist[u] + w > dist[v]:
-                dist[v] = dist[u] + w
-                parent[v] = u
-                x = v
-        if x == -1:
-            break
+
+        for _ in range(n):
+            count("find_max_Avg_cycle.bellman_ford_iterations")
+            x = -1
+            for u, v, w in adjusted_edges:
+                if dist[u] + w > dist[v]:
+                    dist[v] = dist[u] + w
+                    parent[v] = u
+                    x = v
+            if x == -1:
+                break
 
     # Recover cycle
     cycle = []
@@ -1,7 +1,8 @@
 import numpy as np
-import matplotlib.pyplot as plt
-import networkx as nx
 
+from economic_algorithms.instrumentation import count, instrumented
+
+@instrumented
 def is_balanced_matrix(matrix, tol=1e-6):
     """
     Checks if the input matrix is doubly stochastic (i.e., each row and column sums to 1).
@@ -10,11 +11,16 @@ def is_balanced_matrix(matrix, tol=1e-6):
     col_sums = matrix.sum(axis=0)
     return np.allclose(row_sums, 1.0, atol=tol) and np.allclose(col_sums, 1.0, atol=tol)
 
+@instrumented
 def plot_bipartite_matrix_with_matching(matrix, matching=None, step_title="", min_weight=None):
     """
     Visualizes the bipartite matrix as a graph.
     Highlights a matching (in red) and optionally displays a title with the step and minimum weight.
     """
+    # Imported on first use, so matplotlib is only loaded when something is plotted
+    import matplotlib.pyplot as plt
+    import networkx as nx
+
     G = nx.Graph()
     num_rows, num_cols = matrix.shape
     left = [f"A{i}" for i in range(num_rows)]
@@ -62,10 +68,13 @@ def plot_bipartite_matrix_with_matching(matrix, matching=None, step_title="", mi
     ax.axis('off')
     plt.show()
 
+@instrumented
 def find_perfect_matching(matrix):
     """
     Builds a bipartite graph and returns a perfect matching using NetworkX.
     """
+    import networkx as nx
+
     G = nx.Graph()
     num_rows, num_cols = matrix.shape
     left = [f"A{i}" for i in range(num_rows)]
@@ -77,12 +86,15 @@ def find_perfect_matching(matrix):
                 G.add_edge(left[i], right[j], weight=1)
 
     matching = nx.algorithms.matching.max_weight_matching(G, maxcardinality=True)
+    count("find_perfect_matching.matchings_computed")
     return [(int(a[1:]), int(b[1:])) if a.startswith('A') else (int(b[1:]), int(a[1:])) for a, b in matching]
 
-def birkhoff_decomposition(matrix):
+@instrumented
+def birkhoff_decomposition(matrix, plot=True):
     """
     Performs Birkhoff decomposition on a balanced matrix.
     Returns a list of (matching, weight) pairs.
+    If plot is False, the step-by-step graphs are not drawn.
     """
     if not is_balanced_matrix(matrix):
         raise ValueError("❌ Error: The input matrix is not balanced. Birkhoff decomposition cannot proceed.")
@@ -92,16 +104,19 @@ def birkhoff_decomposition(matrix):
     step = 1
 
     while np.any(mat > 1e-6):
+        count("birkhoff_decomposition.iterations")
         matching = find_perfect_matching(mat)
         min_weight = min(mat[i, j] for i, j in matching)
         decompositions.append((matching, min_weight))
 
-        plot_bipartite_matrix_with_matching(mat, matching, f"Step {step}: Before Reduction", min_weight)
+        if plot:
+            plot_bipartite_matrix_with_matching(mat, matching, f"Step {step}: Before Reduction", min_weight)
 
         for i, j in matching:
             mat[i, j] -= min_weight
 
-        plot_bipartite_matrix_with_matching(mat, None, f"Step {step}: After Reduction")
+        if plot:
+            plot_bipartite_matrix_with_matching(mat, None, f"Step {step}: After Reduction")
 
         step += 1
 
@@ -0,0 +1,103 @@
+"""
+Seeded random instance generators for the benchmark suite.
+
+Every generator takes the instance size and a seed, and returns plain Python
+data (or a NumPy array for the Birkhoff matrices), in the same format that the
+corresponding assignment function expects.
+"""
+import math
+import random
+
+import numpy as np
+
+
+def random_valuations(n_agents, n_resources, seed=0):
+    """
+    Value matrix for egalitarian_allocation (Ass2): value_matrix[i][j] in [0, 100].
+    """
+    rng = random.Random(seed)
+    return [[rng.randint(0, 100) for _ in range(n_resources)] for _ in range(n_agents)]
+
+
+def random_sparse_digraph(n, density=0.2, seed=0):
+    """
+    Adjacency matrix for find_max_Avg_cycle (Ass7), -math.inf means no edge.
+    A Hamiltonian cycle 0 → 1 → ... → 0 is always added, so there is at least one cycle.
+    """
+    rng = random.Random(seed)
+    graph = [[-math.inf] * n for _ in range(n)]
+    for u in range(n):
+        for v in range(n):
+            if u != v and rng.random() < density:
+                graph[u][v] = rng.randint(-10, 20)
+    for u in range(n):
+        graph[u][(u + 1) % n] = rng.randint(-10, 20)
+    return graph
+
+
+def random_bistochastic(n, n_permutations=None, seed=0):
+    """
+    Doubly stochastic matrix for birkhoff_decomposition (Ass9): a random convex
+    combination of n_permutations (default n) random permutation matrices.
+    Every row and column sums to the sum of the weights, i.e. exactly 1 up to rounding.
+    """
+    rng = np.random.default_rng(seed)
+    k = n if n_permutations is None else n_permutations
+    weights = rng.random(k) + 0.1
+    weights /= weights.sum()
+    matrix = np.zeros((n, n))
+    for w in weights:
+        matrix[np.arange(n), rng.permutation(n)] += w
+    return matrix
+
+
+def random_approval_profile(n_voters, n_candidates, approval_prob=0.3, seed=0):
+    """
+    Approval sets for prepare_profile / custom_equal_shares_verbose (Ass10).
+    Every voter approves at least one candidate, and the last candidate is always
+    approved by someone so that prepare_profile sees all n_candidates.
+    """
+    rng = random.Random(seed)
+    approval_sets = []
+    for _ in range(n_voters):
+        approved = [c for c in range(n_candidates) if rng.random() < approval_prob]
+        if not approved:
+            approved = [rng.randrange(n_candidates)]
+        approval_sets.append(approved)
+    if all(n_candidates - 1 not in voter for voter in approval_sets):
+        approval_sets[rng.randrange(n_voters)].append(n_candidates - 1)
+    return approval_sets
+
+
+def random_preferences(n_agents, n_topics, total_budget=1000.0, max_support=3, seed=0):
+    """
+    (budget, preferences) for find_decomposition (Ass11).
+    The budget is built from random contributions of C/n per agent,
+    so the instance is always decomposable and the solver does real work.
+    """
+    rng = random.Random(seed)
+    share = total_budget / n_agents
+    budget = [0.0] * n_topics
+    preferences = []
+    for _ in range(n_agents):
+        supported = set(rng.sample(range(n_topics), rng.randint(1, min(max_support, n_topics))))
+        weights = {j: rng.random() + 1e-3 for j in supported}
+        total_weight = sum(weights.values())
+        for j, w in weights.items():
+            budget[j] += share * w / total_weight
+        preferences.append(supported)
+    return [round(b, 6) for b in budget], preferences
+
+
+def random_votes(n_citizens, n_items, total_budget=100, seed=0):
+    """
+    Citizen votes for compute_budget_binary / compute_budget_direct (Ass12).
+    Each vote is an ideal allocation that sums to total_budget.
+    """
+    rng = random.Random(seed)
+    votes = []
+    for _ in range(n_citizens):
+        weights = [rng.random() ** 3 for _ in range(n_items)]
+        total_weight = sum(weights)
+        votes.append([total_budget * w / total_weight for w in weights])
+    return votes
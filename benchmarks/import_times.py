@@ -0,0 +1,121 @@
+"""
+Measures the cold import time of every public entry point of economic_algorithms,
+and checks it against the pinned budgets below.
+
+Each measurement runs in a fresh interpreter: it imports the package, accesses one
+public name, and reports the elapsed time and which heavy dependencies got loaded.
+An entry point fails the check if it is slower than its budget (median of --repeat
+runs), or if importing it loads cvxpy, abcvoting, networkx or matplotlib.
+
+Usage:
+    python benchmarks/import_times.py
+    python benchmarks/import_times.py --output import_times.json
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import economic_algorithms  # noqa: E402
+
+HEAVY_MODULES = ["cvxpy", "abcvoting", "networkx", "matplotlib"]
+
+# Pinned import budgets in seconds. Pure-Python modules should be almost free,
+# the ones that import numpy at module level are allowed numpy's own import time.
+PACKAGE_BUDGET_S = 0.05
+PURE_BUDGET_S = 0.05
+NUMPY_BUDGET_S = 0.5
+IMPORT_BUDGETS_S = {
+    "egalitarian_allocation": NUMPY_BUDGET_S,
+    "find_max_Avg_cycle": PURE_BUDGET_S,
+    "normalize_cycle": PURE_BUDGET_S,
+    "birkhoff_decomposition": NUMPY_BUDGET_S,
+    "is_balanced_matrix": NUMPY_BUDGET_S,
+    "find_perfect_matching": NUMPY_BUDGET_S,
+    "custom_equal_shares_verbose": PURE_BUDGET_S,
+    "prepare_profile": PURE_BUDGET_S,
+    "check_monotonicity": PURE_BUDGET_S,
+    "find_decomposition": PURE_BUDGET_S,
+    "compute_budget_binary": NUMPY_BUDGET_S,
+    "compute_budget_direct": NUMPY_BUDGET_S,
+    "IncrementalMedianBudget": NUMPY_BUDGET_S,
+    "record": PURE_BUDGET_S,
+    "call_with_stats": PURE_BUDGET_S,
+    "profile_call": PURE_BUDGET_S,
+}
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import economic_algorithms
+{access}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"elapsed": elapsed, "heavy": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def probe(name=None):
+    """
+    Imports the package (and accesses `name` if given) in a fresh interpreter.
+    Returns (elapsed seconds, list of heavy modules that got loaded).
+    """
+    access = f"economic_algorithms.{name}" if name else ""
+    code = _PROBE.format(access=access, heavy=HEAVY_MODULES)
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    result = json.loads(out.stdout.strip().splitlines()[-1])
+    return result["elapsed"], result["heavy"]
+
+
+def measure_entry_point(name, repeat):
+    times, heavy = [], set()
+    for _ in range(repeat):
+        elapsed, loaded = probe(name)
+        times.append(elapsed)
+        heavy.update(loaded)
+    return statistics.median(times), sorted(heavy)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check cold import times against the pinned budgets.")
+    parser.add_argument("--repeat", type=int, default=5, help="fresh interpreters per entry point (default: 5)")
+    parser.add_argument("--output", type=Path, help="optionally write the measurements as JSON")
+    args = parser.parse_args(argv)
+
+    entries = [(None, PACKAGE_BUDGET_S)] + [(name, IMPORT_BUDGETS_S[name]) for name in economic_algorithms.__all__]
+    results, failures = [], []
+    for name, budget in entries:
+        label = name or "economic_algorithms"
+        try:
+            elapsed, heavy = measure_entry_point(name, args.repeat)
+        except subprocess.CalledProcessError as e:
+            failures.append(f"{label}: import failed:\n{e.stderr.strip()}")
+            print(f"  {label:<30} ❌ import failed")
+            continue
+        ok = elapsed <= budget and not heavy
+        print(f"  {label:<30} {elapsed * 1000:8.1f}ms  (budget {budget * 1000:.0f}ms)  {'✅' if ok else '❌'}"
+              + (f"  loaded {', '.join(heavy)}" if heavy else ""))
+        if elapsed > budget:
+            failures.append(f"{label}: {elapsed * 1000:.1f}ms > budget {budget * 1000:.0f}ms")
+        if heavy:
+            failures.append(f"{label}: importing it loaded {', '.join(heavy)}")
+        results.append({"entry_point": label, "median_s": elapsed, "budget_s": budget, "heavy_modules": heavy})
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+    if failures:
+        print(f"\n⚠️ {len(failures)} import check(s) failed:")
+        for message in failures:
+            print(f"  • {message}")
+        return 1
+    print("\n✅ All entry points are within their import budgets.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,352 @@
+"""
+Offline benchmark harness for all the assignment algorithms.
+
+For every algorithm it runs a sweep over instance sizes on seeded random inputs
+(see generators.py), and records wall time, peak RSS and peak traced allocations.
+Each (algorithm, size) point runs in a fresh process, so the peak RSS of one
+point does not leak into the next one.
+
+Results are written as JSON, and can be compared against a stored baseline:
+any point that got slower / allocates more than the tolerance is flagged,
+and the script exits with status 1.
+
+Usage:
+    python benchmarks/run_benchmarks.py                      # full sweep
+    python benchmarks/run_benchmarks.py --quick              # two smallest sizes only
+    python benchmarks/run_benchmarks.py --cases find_max_Avg_cycle birkhoff_decomposition
+    python benchmarks/run_benchmarks.py --save-baseline      # store results as the new baseline
+"""
+import argparse
+import contextlib
+import importlib
+import json
+import math
+import multiprocessing
+import os
+import platform
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+ROOT = BENCH_DIR.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(BENCH_DIR))
+
+import generators  # noqa: E402
+
+DEFAULT_OUTPUT = BENCH_DIR / "results.json"
+DEFAULT_BASELINE = BENCH_DIR / "baseline.json"
+
+
+# ------------------------
+# Benchmark cases
+#
+# setup(module, size, seed) builds the call arguments; it runs in the measuring
+# process but outside of the timed region.
+
+def _setup_egalitarian(module, size, seed):
+    return (generators.random_valuations(size, size, seed),), {}
+
+
+def _setup_max_avg_cycle(module, size, seed):
+    return (size, generators.random_sparse_digraph(size, density=0.2, seed=seed)), {}
+
+
+def _setup_birkhoff(module, size, seed):
+    return (generators.random_bistochastic(size, seed=seed),), {"plot": False}
+
+
+def _setup_equal_shares(module, size, seed):
+    approval_sets = generators.random_approval_profile(size, max(2, size // 2), seed=seed)
+    profile = module.prepare_profile(approval_sets)
+    return (profile, max(1, size // 4)), {}
+
+
+def _setup_decomposition(module, size, seed):
+    budget, preferences = generators.random_preferences(size, max(2, size // 2), seed=seed)
+    return (budget, preferences), {}
+
+
+def _setup_budget(module, size, seed):
+    return (100, generators.random_votes(size, 10, total_budget=100, seed=seed)), {}
+
+
+CASES = {
+    "egalitarian_allocation": {
+        "module": "Ass2.egalitarian_allocation",
+        "function": "egalitarian_allocation",
+        "setup": _setup_egalitarian,
+        "sizes": [2, 4, 8, 16, 32],
+        "size_label": "agents = resources",
+    },
+    "find_max_Avg_cycle": {
+        "module": "Ass7.Q3",
+        "function": "find_max_Avg_cycle",
+        "setup": _setup_max_avg_cycle,
+        "sizes": [10, 20, 40, 80, 160],
+        "size_label": "nodes (edge density 0.2)",
+    },
+    "birkhoff_decomposition": {
+        "module": "Ass9.Q2",
+        "function": "birkhoff_decomposition",
+        "setup": _setup_birkhoff,
+        "sizes": [4, 8, 12, 16],
+        "size_label": "matrix size n x n",
+    },
+    "custom_equal_shares_verbose": {
+        "module": "Ass10.Q10",
+        "function": "custom_equal_shares_verbose",
+        "setup": _setup_equal_shares,
+        "sizes": [10, 20, 40, 80, 160],
+        "size_label": "voters (candidates = voters/2, k = voters/4)",
+    },
+    "find_decomposition": {
+        "module": "Ass11.Q3",
+        "function": "find_decomposition",
+        "setup": _setup_decomposition,
+        "sizes": [5, 10, 20, 40],
+        "size_label": "agents (topics = agents/2)",
+    },
+    "compute_budget_binary": {
+        "module": "Ass12.Q5",
+        "function": "compute_budget_binary",
+        "setup": _setup_budget,
+        "sizes": [10, 100, 1000],
+        "size_label": "citizens (10 items)",
+    },
+    "compute_budget_direct": {
+        "module": "Ass12.Q5",
+        "function": "compute_budget_direct",
+        "setup": _setup_budget,
+        "sizes": [10, 100, 1000],
+        "size_label": "citizens (10 items)",
+    },
+}
+
+
+# ------------------------
+# Measurement
+
+def _peak_rss_kb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def measure(case_name, size, seed, repeat):
+    """
+    Runs one (case, size) point and returns its measurements as a dict.
+    The algorithm's own printing is discarded.
+    """
+    case = CASES[case_name]
+    start = time.perf_counter()
+    module = importlib.import_module(case["module"])
+    import_time = time.perf_counter() - start
+    func = getattr(module, case["function"])
+    args, kwargs = case["setup"](module, size, seed)
+    rss_before = _peak_rss_kb()
+
+    times = []
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func(*args, **kwargs)
+            times.append(time.perf_counter() - start)
+        peak_rss = _peak_rss_kb()
+
+        # One extra run under tracemalloc, so its overhead does not pollute the timings
+        tracemalloc.start()
+        func(*args, **kwargs)
+        _, alloc_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return {
+        "case": case_name,
+        "size": size,
+        "seed": seed,
+        "repeat": repeat,
+        "import_time_s": import_time,
+        "wall_time_s": {
+            "min": min(times),
+            "median": statistics.median(times),
+            "mean": statistics.fmean(times),
+        },
+        "rss_before_kb": rss_before,
+        "peak_rss_kb": peak_rss,
+        "alloc_peak_kb": alloc_peak / 1024,
+    }
+
+
+def _measure_in_child(case_name, size, seed, repeat, conn):
+    try:
+        conn.send(measure(case_name, size, seed, repeat))
+    except Exception as e:
+        conn.send({"case": case_name, "size": size, "seed": seed, "error": repr(e)})
+    finally:
+        conn.close()
+
+
+def measure_isolated(case_name, size, seed, repeat):
+    """
+    Runs measure() in a fresh spawned process (clean peak RSS, cold imports).
+    """
+    ctx = multiprocessing.get_context("spawn")
+    recv_conn, send_conn = ctx.Pipe(duplex=False)
+    process = ctx.Process(target=_measure_in_child, args=(case_name, size, seed, repeat, send_conn))
+    process.start()
+    send_conn.close()
+    try:
+        result = recv_conn.recv()
+    except EOFError:
+        result = {"case": case_name, "size": size, "seed": seed,
+                  "error": f"worker exited with code {process.exitcode}"}
+    process.join()
+    return result
+
+
+def scaling_exponent(points):
+    """
+    Least-squares slope of log(time) over log(size): ~1 linear, ~2 quadratic, ...
+    Returns None if there are fewer than two usable points.
+    """
+    xs = [math.log(p["size"]) for p in points if "error" not in p and p["wall_time_s"]["median"] > 0]
+    ys = [math.log(p["wall_time_s"]["median"]) for p in points if "error" not in p and p["wall_time_s"]["median"] > 0]
+    if len(xs) < 2:
+        return None
+    mean_x, mean_y = statistics.fmean(xs), statistics.fmean(ys)
+    var_x = sum((x - mean_x) ** 2 for x in xs)
+    if var_x == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / var_x
+
+
+# ------------------------
+# Baseline comparison
+
+def compare_to_baseline(results, baseline, time_tolerance, memory_tolerance, min_time_delta):
+    """
+    Returns a list of human-readable regression messages (empty if none).
+    A point is only compared if it exists, without errors, in both runs
+    (same case, size and seed).
+    """
+    base_points = {(p["case"], p["size"], p["seed"]): p for p in baseline["results"] if "error" not in p}
+    regressions = []
+    for point in results:
+        base = base_points.get((point["case"], point["size"], point["seed"]))
+        if base is None:
+            continue
+        if "error" in point:
+            regressions.append(f"{point['case']} (size {point['size']}): failed: {point['error']}")
+            continue
+
+        new_time, old_time = point["wall_time_s"]["median"], base["wall_time_s"]["median"]
+        if new_time > old_time * (1 + time_tolerance) and new_time - old_time > min_time_delta:
+            regressions.append(f"{point['case']} (size {point['size']}): time "
+                               f"{old_time:.4f}s → {new_time:.4f}s (+{(new_time / old_time - 1) * 100:.0f}%)")
+
+        new_mem, old_mem = point["alloc_peak_kb"], base["alloc_peak_kb"]
+        if old_mem > 0 and new_mem > old_mem * (1 + memory_tolerance):
+            regressions.append(f"{point['case']} (size {point['size']}): peak allocations "
+                               f"{old_mem:.0f}KB → {new_mem:.0f}KB (+{(new_mem / old_mem - 1) * 100:.0f}%)")
+    return regressions
+
+
+# ------------------------
+# Main
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark all assignment algorithms over size sweeps.")
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES), default=sorted(CASES),
+                        help="algorithms to benchmark (default: all)")
+    parser.add_argument("--sizes", nargs="+", type=int,
+                        help="override the size sweep for every selected case")
+    parser.add_argument("--quick", action="store_true", help="only run the two smallest sizes of each sweep")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per point (default: 3)")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the instance generators (default: 0)")
+    parser.add_argument("--no-isolate", action="store_true",
+                        help="run every point in this process (faster, but peak RSS is cumulative)")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="where to write the JSON results")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="baseline JSON to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="also store the results as the new baseline")
+    parser.add_argument("--time-tolerance", type=float, default=0.25,
+                        help="allowed relative slowdown before flagging (default: 0.25)")
+    parser.add_argument("--memory-tolerance", type=float, default=0.25,
+                        help="allowed relative growth of peak allocations before flagging (default: 0.25)")
+    parser.add_argument("--min-time-delta", type=float, default=0.001,
+                        help="ignore slowdowns smaller than this many seconds (default: 0.001)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    run = measure if args.no_isolate else measure_isolated
+
+    results = []
+    scaling = {}
+    for case_name in args.cases:
+        sizes = args.sizes or CASES[case_name]["sizes"]
+        if args.quick:
+            sizes = sizes[:2]
+        print(f"\n=== {case_name} — size = {CASES[case_name]['size_label']} ===")
+        points = []
+        for size in sizes:
+            point = run(case_name, size, args.seed, args.repeat)
+            points.append(point)
+            if "error" in point:
+                print(f"  size {size:>5}: ❌ {point['error']}")
+            else:
+                print(f"  size {size:>5}: {point['wall_time_s']['median']:.4f}s  "
+                      f"peak RSS {point['peak_rss_kb'] / 1024:.1f}MB  "
+                      f"peak alloc {point['alloc_peak_kb']:.0f}KB")
+        scaling[case_name] = scaling_exponent(points)
+        if scaling[case_name] is not None:
+            print(f"  scaling exponent ≈ {scaling[case_name]:.2f}")
+        results.extend(points)
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "isolated": not args.no_isolate,
+        },
+        "scaling_exponents": scaling,
+        "results": results,
+    }
+    args.output.write_text(json.dumps(report, indent=2))
+    print(f"\nResults written to {args.output}")
+
+    status = 0
+    if args.baseline.exists() and not args.save_baseline:
+        baseline = json.loads(args.baseline.read_text())
+        mismatched = [key for key in ("seed", "repeat") if baseline["meta"].get(key) != report["meta"][key]]
+        regressions = compare_to_baseline(results, baseline, args.time_tolerance,
+                                          args.memory_tolerance, args.min_time_delta)
+        if mismatched:
+            print(f"\n⚠️ Not comparing to {args.baseline}: it was recorded with "
+                  + ", ".join(f"--{key} {baseline['meta'].get(key)}" for key in mismatched)
+                  + ", rerun with the same settings or --save-baseline.")
+            status = 1
+        elif regressions:
+            print(f"\n⚠️ {len(regressions)} regression(s) compared to {args.baseline}:")
+            for message in regressions:
+                print(f"  • {message}")
+            status = 1
+        else:
+            print(f"\n✅ No regressions compared to {args.baseline}")
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2))
+        print(f"Baseline saved to {args.baseline}")
+
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,48 @@
+"""
+Public API of the Economic Algorithms assignments.
+
+    from economic_algorithms import find_max_Avg_cycle, compute_budget_binary
+
+Importing this package does not import any assignment module: each function is
+loaded from its assignment folder on first access, and heavy dependencies
+(cvxpy, abcvoting, networkx, matplotlib) are only loaded when a function that
+needs them is actually called.
+
+Every solver reports phase timings and counters to economic_algorithms.instrumentation,
+see record(), call_with_stats() and profile_call().
+"""
+import importlib
+
+# public name -> module that defines it
+_EXPORTS = {
+    "egalitarian_allocation": "Ass2.egalitarian_allocation",
+    "find_max_Avg_cycle": "Ass7.Q3",
+    "normalize_cycle": "Ass7.Q3",
+    "birkhoff_decomposition": "Ass9.Q2",
+    "is_balanced_matrix": "Ass9.Q2",
+    "find_perfect_matching": "Ass9.Q2",
+    "custom_equal_shares_verbose": "Ass10.Q10",
+    "prepare_profile": "Ass10.Q10",
+    "check_monotonicity": "Ass10.Q10",
+    "find_decomposition": "Ass11.Q3",
+    "compute_budget_binary": "Ass12.Q5",
+    "compute_budget_direct": "Ass12.Q5",
+    "IncrementalMedianBudget": "Ass12.Q5",
+    "record": "economic_algorithms.instrumentation",
+    "call_with_stats": "economic_algorithms.instrumentation",
+    "profile_call": "economic_algorithms.instrumentation",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
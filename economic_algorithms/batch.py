@@ -0,0 +1,471 @@
+"""
+Batch runner: streams job records from JSONL or NPZ, runs every job in a bounded
+process pool, and streams the results out as JSONL or NPZ.
+
+A job is one mechanism call. In JSONL, one job per line:
+
+    {"id": "a", "mechanism": "find_max_Avg_cycle", "inputs": {"graph": [[null, 2], [3, null]]}}
+
+In NPZ, the arrays of job number i are stored under "<i>.<field>", e.g.
+"0.mechanism" (a string array), "0.id" (optional) and "0.value_matrix".
+
+Mechanisms and their inputs:
+    egalitarian_allocation        value_matrix
+    find_max_Avg_cycle            graph (null / -Infinity = no edge)
+    birkhoff_decomposition        matrix
+    custom_equal_shares_verbose   approval_sets (or approval_matrix of 0/1), k
+    find_decomposition            budget, preferences (or preference_matrix of 0/1)
+    compute_budget_binary         total_budget, citizen_votes
+    compute_budget_direct         total_budget, citizen_votes
+
+Every result record has the job's index, id, mechanism, ok, elapsed_s, and either
+result or error, so one bad job never stops the batch. The index is the job's
+position in the input (the 0-based line number in JSONL, <i> in NPZ), and NPZ
+results are stored under the same "<index>." prefix. A job without an id gets its
+index as id; a line or member that cannot be read gets "line <n>" / the member name.
+
+Usage:
+    python -m economic_algorithms.batch jobs.jsonl -o results.jsonl --workers 4
+    python -m economic_algorithms.batch jobs.npz -o results.npz --unordered
+    cat jobs.jsonl | python -m economic_algorithms.batch - > results.jsonl
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import time
+import traceback
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+
+# ------------------------
+# Mechanisms
+#
+# Each adapter takes the job inputs (plain Python / NumPy values) and returns a dict
+# of result fields that is JSON-serializable and, field by field, storable in NPZ.
+
+def _to_list(value):
+    return value.tolist() if hasattr(value, "tolist") else value
+
+
+def _run_egalitarian_allocation(inputs):
+    from economic_algorithms import egalitarian_allocation
+
+    allocation = egalitarian_allocation(_to_list(inputs["value_matrix"]))
+    return {"allocation": allocation.tolist()}
+
+
+def _run_find_max_avg_cycle(inputs):
+    from economic_algorithms import find_max_Avg_cycle
+
+    graph = [[-math.inf if w is None else float(w) for w in row] for row in _to_list(inputs["graph"])]
+    max_avg, cycle = find_max_Avg_cycle(len(graph), graph)
+    return {"max_avg": float(max_avg), "cycle": cycle}
+
+
+def _run_birkhoff_decomposition(inputs):
+    import numpy as np
+
+    from economic_algorithms import birkhoff_decomposition
+
+    matrix = np.array(inputs["matrix"], dtype=float)
+    decompositions = birkhoff_decomposition(matrix, plot=False)
+    # permutations[k][i] is the column matched to row i in the k-th matching
+    permutations = []
+    for matching, _ in decompositions:
+        permutation = [-1] * matrix.shape[0]
+        for i, j in matching:
+            permutation[i] = j
+        permutations.append(permutation)
+    return {"permutations": permutations, "weights": [float(w) for _, w in decompositions]}
+
+
+def _run_equal_shares(inputs):
+    from economic_algorithms import custom_equal_shares_verbose, prepare_profile
+
+    if "approval_sets" in inputs:
+        approval_sets = [list(voter) for voter in _to_list(inputs["approval_sets"])]
+    else:
+        approval_sets = [[c for c, approved in enumerate(row) if approved]
+                         for row in _to_list(inputs["approval_matrix"])]
+    profile = prepare_profile(approval_sets)
+    committee = custom_equal_shares_verbose(profile, int(inputs["k"]))
+    return {"committee": sorted(committee)}
+
+
+def _run_find_decomposition(inputs):
+    from economic_algorithms import find_decomposition
+
+    if "preferences" in inputs:
+        preferences = [set(agent) for agent in _to_list(inputs["preferences"])]
+    else:
+        preferences = [{j for j, supported in enumerate(row) if supported}
+                       for row in _to_list(inputs["preference_matrix"])]
+    decomposition = find_decomposition([float(b) for b in _to_list(inputs["budget"])], preferences)
+    return {"decomposable": decomposition is not None, "decomposition": decomposition}
+
+
+def _run_compute_budget_binary(inputs):
+    from economic_algorithms import compute_budget_binary
+
+    allocation = compute_budget_binary(float(inputs["total_budget"]), _to_list(inputs["citizen_votes"]))
+    return {"allocation": allocation}
+
+
+def _run_compute_budget_direct(inputs):
+    from economic_algorithms import compute_budget_direct
+
+    allocation = compute_budget_direct(float(inputs["total_budget"]), _to_list(inputs["citizen_votes"]))
+    return {"allocation": allocation}
+
+
+MECHANISMS = {
+    "egalitarian_allocation": _run_egalitarian_allocation,
+    "find_max_Avg_cycle": _run_find_max_avg_cycle,
+    "birkhoff_decomposition": _run_birkhoff_decomposition,
+    "custom_equal_shares_verbose": _run_equal_shares,
+    "find_decomposition": _run_find_decomposition,
+    "compute_budget_binary": _run_compute_budget_binary,
+    "compute_budget_direct": _run_compute_budget_direct,
+}
+
+
+# ------------------------
+# Running one job (inside a worker process)
+
+def _init_worker():
+    # The solvers print their steps; keep them out of the result stream
+    sys.stdout = open(os.devnull, "w")
+
+
+def _job_record(job):
+    return {"seq": job["seq"], "index": job.get("index"), "id": job.get("id"), "mechanism": job.get("mechanism")}
+
+
+def run_job(job, collect_stats=False):
+    """
+    Runs one job and returns its result record. Never raises, except on KeyboardInterrupt
+    (a solver calling sys.exit() only fails its own job).
+    """
+    record = _job_record(job)
+    start = time.perf_counter()
+    try:
+        if "error" in job:
+            raise ValueError(job["error"])
+        if job["mechanism"] not in MECHANISMS:
+            raise ValueError(f"Unknown mechanism {job['mechanism']!r}, expected one of {sorted(MECHANISMS)}")
+        adapter = MECHANISMS[job["mechanism"]]
+        if collect_stats:
+            from economic_algorithms.instrumentation import record as record_stats
+
+            with record_stats() as stats:
+                record["result"] = adapter(job["inputs"])
+            record["stats"] = stats.as_dict()
+        else:
+            record["result"] = adapter(job["inputs"])
+        record["ok"] = True
+    except KeyboardInterrupt:
+        raise
+    except BaseException as e:
+        record["ok"] = False
+        record["error"] = f"{type(e).__name__}: {e}"
+        record["traceback"] = traceback.format_exc(limit=-3)
+    record["elapsed_s"] = time.perf_counter() - start
+    return record
+
+
+# ------------------------
+# Streaming input
+
+# Every job dict has "seq", its position in the stream of jobs. It is internal to
+# run_batch (ordering and bookkeeping) and is not written out; "index" is the
+# position in the input file that the results are keyed by.
+
+def _error_job(seq, index, job_id, error):
+    return {"seq": seq, "index": index, "id": job_id, "mechanism": None, "error": error}
+
+
+def read_jsonl(stream):
+    """
+    Yields one job dict per non-empty line of a binary (or text) stream. Lines that
+    cannot be decoded or parsed yield a job carrying an "error", so they show up as
+    failed results instead of stopping the batch.
+    """
+    seq = 0
+    for index, line in enumerate(stream):
+        if not line.strip():
+            continue
+        try:
+            if isinstance(line, bytes):
+                line = line.decode("utf-8")
+            record = json.loads(line)
+            job = {"seq": seq, "index": index, "id": record.get("id", index), "mechanism": record["mechanism"],
+                   "inputs": record.get("inputs", {})}
+        except (ValueError, KeyError, AttributeError, TypeError) as e:
+            job = _error_job(seq, index, f"line {index + 1}", f"line {index + 1}: cannot parse job ({e!r})")
+        yield job
+        seq += 1
+
+
+def read_npz(path):
+    """
+    Yields one job dict per job index found in the NPZ file.
+    Arrays are loaded lazily, one job at a time. A member that is not named
+    "<index>.<field>", or a job whose arrays cannot be loaded (e.g. object arrays,
+    which need pickle), yields a job carrying an "error" instead of stopping the batch.
+    The index of a stray member's job is the member name, so it cannot shadow a real job.
+    """
+    import numpy as np
+
+    try:
+        data = np.load(path, allow_pickle=False)
+    except Exception as e:
+        yield _error_job(0, None, str(path), f"cannot open {path} ({e!r})")
+        return
+
+    with data:
+        fields, stray = {}, []
+        for key in data.files:
+            index, _, field = key.partition(".")
+            if index.isdigit() and field:
+                fields.setdefault(int(index), []).append(field)
+            else:
+                stray.append(key)
+
+        seq = 0
+        for key in stray:
+            yield _error_job(seq, key, key, f"member {key!r} is not named '<index>.<field>'")
+            seq += 1
+        for index in sorted(fields):
+            try:
+                inputs = {field: data[f"{index}.{field}"] for field in fields[index]}
+                mechanism = inputs.pop("mechanism", None)
+                job_id = inputs.pop("id", index)
+                job = {"seq": seq, "index": index, "id": _to_list(job_id), "mechanism": _to_list(mechanism),
+                       "inputs": inputs}
+                if mechanism is None:
+                    job["error"] = f"job {index} has no '{index}.mechanism' array"
+            except Exception as e:
+                job = _error_job(seq, index, f"job {index}", f"job {index}: cannot load arrays ({e!r})")
+            yield job
+            seq += 1
+
+
+# ------------------------
+# Streaming output
+
+def _finite(value):
+    # NaN / Infinity are not valid JSON, write them as null
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _finite(v) for key, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(v) for v in value]
+    return value
+
+
+class JsonlWriter:
+    """
+    Writes each result as one line of strict JSON (non-finite floats become null).
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, record):
+        record = {key: value for key, value in record.items() if key != "seq"}
+        self.stream.write(json.dumps(_finite(record), allow_nan=False) + "\n")
+        self.stream.flush()
+
+    def close(self):
+        if self.stream is not sys.stdout:
+            self.stream.close()
+
+
+class NpzWriter:
+    """
+    Writes each result as soon as it arrives, as "<index>.<field>.npy" members of the
+    archive (the layout np.load expects), where index is the job's input index.
+    Fields that cannot be stored as an array (None, ragged lists) are stored as JSON
+    strings under "<index>.<field>_json".
+    """
+
+    def __init__(self, path):
+        self.zip = zipfile.ZipFile(path, "w", compression=zipfile.ZIP_STORED, allowZip64=True)
+
+    def _write_array(self, name, value):
+        import numpy as np
+
+        try:
+            array = np.asarray(value)
+            if array.dtype == object:
+                raise ValueError("not a rectangular array")
+        except ValueError:
+            name, array = f"{name}_json", np.asarray(json.dumps(_finite(value)))
+        with self.zip.open(f"{name}.npy", "w", force_zip64=True) as f:
+            np.lib.format.write_array(f, array, allow_pickle=False)
+
+    def write(self, record):
+        prefix = record["index"] if record["index"] is not None else f"seq{record['seq']}"
+        for key, value in record.items():
+            if key in ("seq", "index"):
+                continue
+            if key == "result":
+                for field, field_value in value.items():
+                    self._write_array(f"{prefix}.result.{field}", field_value)
+            elif value is not None:
+                self._write_array(f"{prefix}.{key}", value)
+
+    def close(self):
+        self.zip.close()
+
+
+# ------------------------
+# Worker pool
+
+def _run_alone(job, collect_stats):
+    """
+    Runs one job in a fresh single-worker pool, reporting a crash of that worker as a failure.
+    """
+    with ProcessPoolExecutor(max_workers=1, initializer=_init_worker) as solo:
+        try:
+            return solo.submit(run_job, job, collect_stats).result()
+        except BrokenProcessPool:
+            return dict(_job_record(job), ok=False, error="worker process died while running this job",
+                        elapsed_s=None)
+
+
+def run_batch(jobs, workers=None, max_pending=None, ordered=True, collect_stats=False):
+    """
+    Runs the jobs in a process pool and yields their result records.
+
+    At most max_pending jobs (default: 2 x workers) are read from the input and not yet
+    yielded at any time, so a large input is never loaded in full and results do not pile
+    up when the consumer is slow. With ordered=True results come out in input order,
+    otherwise as soon as they complete. The jobs are dicts as yielded by read_jsonl /
+    read_npz; their "seq" (0, 1, 2, ... in stream order) is what the ordering relies on.
+
+    If a worker process dies (e.g. a native crash in a solver), the pool is restarted and
+    every job that was in it is re-run alone in its own process, so that only the job
+    that actually crashed is reported as failed.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_pending = max(max_pending or 2 * workers, 1)
+
+    jobs = iter(jobs)
+    exhausted = False
+    pending = {}  # future -> job
+    finished = {}  # seq -> record, waiting for its turn (ordered mode)
+    next_seq = 0
+    pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+
+    def recover():
+        # The pool is broken: keep the results that made it out, re-run the rest alone
+        pool.shutdown(wait=False, cancel_futures=True)
+        for future, job in pending.items():
+            if future.done() and not future.cancelled() and future.exception() is None:
+                finished[job["seq"]] = future.result()
+            else:
+                finished[job["seq"]] = _run_alone(job, collect_stats)
+        pending.clear()
+        return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+
+    try:
+        while True:
+            # Backpressure: only read more input while the window has room
+            while not exhausted and len(pending) + len(finished) < max_pending:
+                job = next(jobs, None)
+                if job is None:
+                    exhausted = True
+                elif "error" in job:
+                    finished[job["seq"]] = run_job(job)
+                else:
+                    try:
+                        future = pool.submit(run_job, job, collect_stats)
+                    except BrokenProcessPool:
+                        pool = recover()
+                        future = pool.submit(run_job, job, collect_stats)
+                    pending[future] = job
+
+            if pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                try:
+                    for future in done:
+                        finished[pending[future]["seq"]] = future.result()
+                        del pending[future]
+                except BrokenProcessPool:
+                    pool = recover()
+
+            if ordered:
+                while next_seq in finished:
+                    yield finished.pop(next_seq)
+                    next_seq += 1
+            else:
+                for seq in sorted(finished):
+                    yield finished.pop(seq)
+
+            if exhausted and not pending and not finished:
+                return
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+# ------------------------
+# Command line
+
+def _open_input(path):
+    if path == "-":
+        return read_jsonl(sys.stdin.buffer)
+    if path.endswith(".npz"):
+        return read_npz(path)
+    return _read_jsonl_file(path)
+
+
+def _read_jsonl_file(path):
+    with open(path, "rb") as f:
+        yield from read_jsonl(f)
+
+
+def _open_output(path):
+    if path == "-":
+        return JsonlWriter(sys.stdout)
+    if path.endswith(".npz"):
+        return NpzWriter(path)
+    return JsonlWriter(open(path, "w"))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a batch of mechanism jobs in a process pool.")
+    parser.add_argument("input", help="jobs file (.jsonl or .npz), or - for JSONL on stdin")
+    parser.add_argument("-o", "--output", default="-", help="results file (.jsonl or .npz), default: stdout")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--max-pending", type=int, default=None,
+                        help="max jobs read but not yet written (default: 2 x workers)")
+    parser.add_argument("--unordered", action="store_true", help="write results as they complete")
+    parser.add_argument("--stats", action="store_true", help="attach per-job instrumentation stats")
+    args = parser.parse_args(argv)
+
+    writer = _open_output(args.output)
+    total = failed = 0
+    start = time.perf_counter()
+    try:
+        for record in run_batch(_open_input(args.input), args.workers, args.max_pending,
+                                ordered=not args.unordered, collect_stats=args.stats):
+            writer.write(record)
+            total += 1
+            if not record["ok"]:
+                failed += 1
+                print(f"❌ job {record['id']!r} ({record['mechanism']}): {record['error']}", file=sys.stderr)
+    finally:
+        writer.close()
+
+    print(f"{total} jobs, {failed} failed, {time.perf_counter() - start:.2f}s", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
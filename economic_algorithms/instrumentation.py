@@ -0,0 +1,230 @@
+"""
+Named phase timers and counters that the solvers report into.
+
+Collection is off by default: phase() then returns a shared no-op context manager
+and count() returns immediately, so each call site costs a function call and a
+context variable lookup. To collect data for a call, run it inside record():
+
+    from economic_algorithms.instrumentation import record
+
+    with record() as stats:
+        find_max_Avg_cycle(n, graph)
+    print(stats.summary())
+    stats.write_chrome_trace("trace.json")   # open in chrome://tracing or Perfetto
+
+or use call_with_stats() / profile_call() for a single call.
+
+The active Stats is held in a context variable, so record() only collects what runs
+in its own thread (or asyncio task); other threads keep running uninstrumented.
+Phases nest: each phase reports its total time and its self time, i.e. the total
+minus the time spent in the phases opened inside it.
+
+The assignment modules import phase / count / instrumented from here, so run them
+as modules from the repository root (e.g. `python -m Ass7.Q3`), or install the
+repository with `pip install -e .`.
+"""
+import contextlib
+import contextvars
+import functools
+import os
+import threading
+import time
+from collections import Counter
+
+# The Stats currently recording in this context, or None when disabled
+_collector = contextvars.ContextVar("economic_algorithms_collector", default=None)
+
+
+class Stats:
+    """
+    Phase timings, counters and trace events collected during one record() block.
+
+    Attributes:
+        phases (dict): phase name -> [number of calls, total nanoseconds, self nanoseconds].
+        counters (Counter): counter name -> value.
+        events (list): (name, start_ns, end_ns, thread id) for every finished phase.
+    """
+
+    def __init__(self):
+        self.phases = {}
+        self.counters = Counter()
+        self.events = []
+        self.origin_ns = time.perf_counter_ns()
+        self._open = []  # phases currently running, innermost last
+
+    def _add_phase(self, name, start_ns, end_ns, child_ns):
+        entry = self.phases.get(name)
+        if entry is None:
+            self.phases[name] = [1, end_ns - start_ns, end_ns - start_ns - child_ns]
+        else:
+            entry[0] += 1
+            entry[1] += end_ns - start_ns
+            entry[2] += end_ns - start_ns - child_ns
+        self.events.append((name, start_ns, end_ns, threading.get_ident()))
+
+    def phase_time(self, name, exclusive=False):
+        """
+        Total seconds spent in phase `name` (0.0 if it never ran).
+        With exclusive=True, the time spent in phases nested inside it is left out.
+        """
+        entry = self.phases.get(name)
+        if entry is None:
+            return 0.0
+        return (entry[2] if exclusive else entry[1]) / 1e9
+
+    def as_dict(self):
+        """
+        JSON-serializable per-call statistics.
+        """
+        return {
+            "phases": {name: {"calls": calls, "total_s": total_ns / 1e9, "self_s": self_ns / 1e9}
+                       for name, (calls, total_ns, self_ns) in self.phases.items()},
+            "counters": dict(self.counters),
+        }
+
+    def chrome_trace(self):
+        """
+        The phases as Chrome trace-event JSON ("X" complete events, microseconds).
+        Counters are attached as a final "C" counter event.
+        """
+        pid = os.getpid()
+        trace_events = [
+            {"name": name, "cat": name.split(".")[0], "ph": "X", "pid": pid, "tid": tid,
+             "ts": (start_ns - self.origin_ns) / 1000, "dur": (end_ns - start_ns) / 1000}
+            for name, start_ns, end_ns, tid in self.events
+        ]
+        if self.counters:
+            end_ts = max((e["ts"] + e["dur"] for e in trace_events), default=0)
+            trace_events.append({"name": "counters", "ph": "C", "pid": pid, "tid": 0,
+                                 "ts": end_ts, "args": dict(self.counters)})
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path):
+        import json
+
+        with open(path, "w") as f:
+            json.dump(self.chrome_trace(), f)
+
+    def summary(self):
+        """
+        Human-readable table of phases (slowest first, by total time) and counters.
+        """
+        lines = [f"Phases:{'total':>58}{'self':>13}"]
+        for name, (calls, total_ns, self_ns) in sorted(self.phases.items(), key=lambda item: -item[1][1]):
+            lines.append(f"  {name:<50} {total_ns / 1e6:10.3f}ms {self_ns / 1e6:10.3f}ms  ({calls} calls)")
+        lines.append("Counters:")
+        for name, value in sorted(self.counters.items()):
+            lines.append(f"  {name:<50} {value}")
+        return "\n".join(lines)
+
+
+class _Phase:
+    __slots__ = ("stats", "name", "start_ns", "child_ns")
+
+    def __init__(self, stats, name):
+        self.stats = stats
+        self.name = name
+        self.child_ns = 0
+
+    def __enter__(self):
+        self.stats._open.append(self)
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        end_ns = time.perf_counter_ns()
+        open_phases = self.stats._open
+        open_phases.pop()
+        if open_phases:
+            open_phases[-1].child_ns += end_ns - self.start_ns
+        self.stats._add_phase(self.name, self.start_ns, end_ns, self.child_ns)
+        return False
+
+
+class _NullPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+
+def phase(name):
+    """
+    Context manager timing the block as phase `name` (no-op when not recording).
+    """
+    stats = _collector.get()
+    if stats is None:
+        return _NULL_PHASE
+    return _Phase(stats, name)
+
+
+def count(name, n=1):
+    """
+    Adds n to counter `name` (no-op when not recording).
+    """
+    stats = _collector.get()
+    if stats is not None:
+        stats.counters[name] += n
+
+
+def instrumented(func):
+    """
+    Decorator timing every call of func as a phase named after it (its qualified name).
+    """
+    name = func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        stats = _collector.get()
+        if stats is None:
+            return func(*args, **kwargs)
+        with _Phase(stats, name):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+@contextlib.contextmanager
+def record():
+    """
+    Enables collection for the duration of the block and yields the Stats object.
+    A nested record() collects into its own Stats until it exits.
+    Only the current thread / asyncio task records into it.
+    """
+    stats = Stats()
+    token = _collector.set(stats)
+    try:
+        yield stats
+    finally:
+        _collector.reset(token)
+
+
+def call_with_stats(func, *args, **kwargs):
+    """
+    Calls func(*args, **kwargs) with collection enabled.
+    Returns (result, Stats).
+    """
+    with record() as stats:
+        result = func(*args, **kwargs)
+    return result, stats
+
+
+def profile_call(func, *args, **kwargs):
+    """
+    Like call_with_stats, but also captures a cProfile of the call.
+    Returns (result, Stats, pstats.Stats).
+    """
+    # cProfile and pstats are only needed here, keep them out of the import of this module
+    import cProfile
+    import pstats
+
+    profiler = cProfile.Profile()
+    with record() as stats:
+        result = profiler.runcall(func, *args, **kwargs)
+    return result, stats, pstats.Stats(profiler)
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The assignment packages (Ass2, ..., Ass12) and economic_algorithms live at the repository root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,152 @@
+import io
+import json
+import math
+import multiprocessing
+import os
+import time
+
+import pytest
+
+from economic_algorithms import batch, compute_budget_direct
+
+# Test adapters are registered in this process; forked workers inherit them
+needs_fork = pytest.mark.skipif(multiprocessing.get_start_method() != "fork",
+                                reason="test mechanisms only reach fork-started workers")
+
+
+def _sleep(inputs):
+    time.sleep(inputs["seconds"])
+    return {"slept": inputs["seconds"]}
+
+
+def _crash(inputs):
+    if inputs.get("crash"):
+        os._exit(1)
+    return {"crashed": False}
+
+
+def _exit(inputs):
+    raise SystemExit(3)
+
+
+def _interrupt(inputs):
+    raise KeyboardInterrupt
+
+
+batch.MECHANISMS.update({"_test_sleep": _sleep, "_test_crash": _crash,
+                         "_test_exit": _exit, "_test_interrupt": _interrupt})
+
+
+def jsonl(*records):
+    return io.BytesIO("".join(line if isinstance(line, str) else json.dumps(line) + "\n"
+                              for line in records).encode())
+
+
+def cycle_job(job_id, graph):
+    return {"id": job_id, "mechanism": "find_max_Avg_cycle", "inputs": {"graph": graph}}
+
+
+@needs_fork
+def test_ordered_and_unordered_output():
+    seconds = [0.3, 0.0, 0.1]
+    jobs = [{"id": i, "mechanism": "_test_sleep", "inputs": {"seconds": s}} for i, s in enumerate(seconds)]
+
+    ordered = list(batch.run_batch(batch.read_jsonl(jsonl(*jobs)), workers=3))
+    assert [r["id"] for r in ordered] == [0, 1, 2]
+    assert all(r["ok"] for r in ordered)
+
+    unordered = list(batch.run_batch(batch.read_jsonl(jsonl(*jobs)), workers=3, ordered=False))
+    assert [r["id"] for r in unordered] == [1, 2, 0]
+
+
+@needs_fork
+@pytest.mark.parametrize("ordered", [True, False])
+def test_max_pending_bounds_the_jobs_read_ahead(ordered):
+    reads = 0
+
+    def jobs():
+        nonlocal reads
+        for job in batch.read_jsonl(jsonl(*[{"mechanism": "_test_sleep", "inputs": {"seconds": 0.01}}] * 20)):
+            reads += 1
+            yield job
+
+    results = 0
+    for _ in batch.run_batch(jobs(), workers=2, max_pending=3, ordered=ordered):
+        assert reads - results <= 3
+        results += 1
+    assert results == reads == 20
+
+
+def test_parse_and_unknown_mechanism_errors():
+    lines = jsonl(cycle_job("good", [[None, 2], [3, None]]), "not json\n", "\n", {"inputs": {}},
+                  {"id": 0, "mechanism": "nope"})
+    results = list(batch.run_batch(batch.read_jsonl(lines), workers=1))
+
+    assert [(r["index"], r["id"], r["ok"]) for r in results] == [
+        (0, "good", True), (1, "line 2", False), (3, "line 4", False), (4, 0, False)]
+    assert results[0]["result"]["max_avg"] == 2.5
+    assert "cannot parse job" in results[1]["error"]
+    assert "Unknown mechanism 'nope'" in results[3]["error"]
+
+
+@needs_fork
+def test_dead_worker_only_fails_its_own_job():
+    jobs = [{"id": i, "mechanism": "_test_crash", "inputs": {"crash": i == 2}} for i in range(6)]
+    results = list(batch.run_batch(batch.read_jsonl(jsonl(*jobs)), workers=2))
+
+    assert [r["id"] for r in results] == list(range(6))
+    assert [r["ok"] for r in results] == [True, True, False, True, True, True]
+    assert "worker process died" in results[2]["error"]
+
+
+def test_system_exit_fails_the_job_but_keyboard_interrupt_propagates():
+    record = batch.run_job({"seq": 0, "index": 0, "id": "x", "mechanism": "_test_exit", "inputs": {}})
+    assert not record["ok"] and record["error"].startswith("SystemExit")
+
+    with pytest.raises(KeyboardInterrupt):
+        batch.run_job({"seq": 0, "index": 0, "id": "x", "mechanism": "_test_interrupt", "inputs": {}})
+
+
+def test_jsonl_writer_writes_strict_json():
+    out = io.StringIO()
+    writer = batch.JsonlWriter(out)
+    # A graph without any cycle gives max_avg = -inf
+    for record in batch.run_batch(batch.read_jsonl(jsonl(cycle_job("no cycle", [[None, 1], [None, None]]))),
+                                  workers=1):
+        writer.write(record)
+
+    line = out.getvalue()
+    assert "Infinity" not in line and "NaN" not in line
+    record = json.loads(line)
+    assert record["ok"] and record["result"]["max_avg"] is None
+    assert "seq" not in record
+
+
+def test_npz_round_trip(tmp_path):
+    np = pytest.importorskip("numpy")
+    votes = [[70, 30, 0], [60, 40, 0], [80, 20, 0]]
+    graph = [[-math.inf, 2], [3, -math.inf]]
+    source = tmp_path / "jobs.npz"
+    np.savez(source, **{
+        "junk": np.zeros(1),  # stray member, must not shift the job indices
+        "0.mechanism": np.array("compute_budget_direct"), "0.total_budget": np.array(100.0),
+        "0.citizen_votes": np.array(votes, dtype=float),
+        "2.mechanism": np.array("find_max_Avg_cycle"), "2.id": np.array("cycle"), "2.graph": np.array(graph),
+        "5.mechanism": np.array("nope"),
+    })
+
+    target = tmp_path / "results.npz"
+    writer = batch.NpzWriter(target)
+    for record in batch.run_batch(batch.read_npz(source), workers=2):
+        writer.write(record)
+    writer.close()
+
+    with np.load(target) as results:
+        assert bool(results["0.ok"]) and bool(results["2.ok"]) and not bool(results["5.ok"])
+        assert results["0.result.allocation"].tolist() == compute_budget_direct(100, votes)
+        assert str(results["2.id"]) == "cycle"
+        assert float(results["2.result.max_avg"]) == 2.5
+        assert sorted(results["2.result.cycle"].tolist()) == [0, 1, 1]
+        assert "Unknown mechanism" in str(results["5.error"])
+        assert not bool(results["junk.ok"])
+        assert not any(key.startswith(("1.", "3.")) for key in results.files)
@@ -0,0 +1,26 @@
+"""
+The benchmark generators must produce valid inputs at every size of the sweep,
+otherwise the benchmark only measures the input validation failing.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("numpy")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "benchmarks"))
+
+import generators  # noqa: E402
+from run_benchmarks import CASES  # noqa: E402
+
+from Ass9.Q2 import is_balanced_matrix  # noqa: E402
+
+
+@pytest.mark.parametrize("size", CASES["birkhoff_decomposition"]["sizes"])
+@pytest.mark.parametrize("seed", range(3))
+def test_random_bistochastic_is_balanced(size, seed):
+    matrix = generators.random_bistochastic(size, seed=seed)
+    assert matrix.shape == (size, size)
+    assert (matrix >= 0).all()
+    assert is_balanced_matrix(matrix)
@@ -0,0 +1,39 @@
+"""
+Pins the cold import time of every public entry point of economic_algorithms
+(budgets in benchmarks/import_times.py), and checks that importing them does not
+load any heavy dependency.
+"""
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "benchmarks"))
+
+import import_times  # noqa: E402
+from import_times import IMPORT_BUDGETS_S, NUMPY_BUDGET_S, PACKAGE_BUDGET_S  # noqa: E402
+
+import economic_algorithms  # noqa: E402
+
+REPEAT = 3
+
+
+def test_every_entry_point_has_a_budget():
+    assert set(IMPORT_BUDGETS_S) == set(economic_algorithms.__all__)
+
+
+def test_package_import():
+    elapsed, heavy = import_times.measure_entry_point(None, REPEAT)
+    assert heavy == []
+    assert elapsed <= PACKAGE_BUDGET_S
+
+
+@pytest.mark.parametrize("name", economic_algorithms.__all__)
+def test_entry_point_import(name):
+    budget = IMPORT_BUDGETS_S[name]
+    if budget == NUMPY_BUDGET_S and importlib.util.find_spec("numpy") is None:
+        pytest.skip("numpy is not installed")
+    elapsed, heavy = import_times.measure_entry_point(name, REPEAT)
+    assert heavy == [], f"importing {name} loaded {', '.join(heavy)}"
+    assert elapsed <= budget, f"{name}: {elapsed * 1000:.1f}ms > budget {budget * 1000:.0f}ms"
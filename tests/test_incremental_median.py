@@ -0,0 +1,72 @@
+import math
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from Ass12.Q5 import IncrementalMedianBudget, compute_budget_binary  # noqa: E402
+
+
+def random_vote(rng, m, total):
+    weights = [rng.random() ** 3 for _ in range(m)]
+    return [total * w / sum(weights) for w in weights]
+
+
+def test_empty_allocation_is_zero():
+    assert IncrementalMedianBudget(100, 3).allocation() == [0.0, 0.0, 0.0]
+
+
+def test_single_voter_gets_their_vote():
+    live = IncrementalMedianBudget(100, 3)
+    live.add_vote("a", [70, 30, 0])
+    assert live.allocation() == pytest.approx([70, 30, 0])
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_compute_budget_binary_over_a_stream(seed):
+    rng = random.Random(seed)
+    total, m = 100, 4
+    live = IncrementalMedianBudget(total, m)
+    votes = {}
+    for step in range(40):
+        op = rng.random()
+        if votes and op < 0.2:
+            voter = rng.choice(list(votes))
+            live.remove_vote(voter)
+            del votes[voter]
+        elif votes and op < 0.4:
+            voter = rng.choice(list(votes))
+            votes[voter] = random_vote(rng, m, total)
+            live.replace_vote(voter, votes[voter])
+        else:
+            votes[step] = random_vote(rng, m, total)
+            live.add_vote(step, votes[step])
+        if not votes:
+            continue
+        try:
+            expected = compute_budget_binary(total, list(votes.values()))
+        except TypeError:
+            continue  # compute_budget_binary finds no t with a sum <= total for this profile
+        for got, want in zip(live.allocation(), expected):
+            assert math.isclose(got, want, rel_tol=1e-4, abs_tol=1e-4 * total)
+
+
+@pytest.mark.parametrize("bad_vote", [[None, 1, 2], [1, 2], 5, ["x", 1, 2], [math.nan, 1, 2],
+                                      [math.inf, 0, 0], [-10, 60, 50]])
+def test_failed_replace_keeps_the_old_vote(bad_vote):
+    live = IncrementalMedianBudget(100, 3)
+    live.add_vote("a", [50, 25, 25])
+    with pytest.raises((TypeError, ValueError)):
+        live.replace_vote("a", bad_vote)
+    assert live.votes == {"a": [50.0, 25.0, 25.0]}
+    assert live.columns == [[50.0], [25.0], [25.0]]
+
+
+def test_non_finite_vote_is_rejected_before_any_state_change():
+    live = IncrementalMedianBudget(100, 1)
+    with pytest.raises(ValueError):
+        live.add_vote("x", [math.nan])
+    live.add_vote("y", [50])
+    live.remove_vote("y")
+    assert live.votes == {} and live.columns == [[]]
@@ -0,0 +1,47 @@
+import threading
+import time
+
+from economic_algorithms.instrumentation import count, instrumented, phase, record
+
+
+def test_disabled_outside_record():
+    with phase("idle"):
+        count("idle")
+    with record() as stats:
+        pass
+    assert stats.phases == {} and not stats.counters
+
+
+def test_nested_phases_report_self_time():
+    @instrumented
+    def outer():
+        with phase("inner"):
+            time.sleep(0.02)
+        time.sleep(0.01)
+
+    with record() as stats:
+        outer()
+    name = outer.__qualname__
+    assert stats.phase_time(name) >= stats.phase_time("inner") >= 0.02
+    assert stats.phase_time("inner", exclusive=True) == stats.phase_time("inner")
+    assert 0.01 <= stats.phase_time(name, exclusive=True) < stats.phase_time("inner")
+    assert stats.as_dict()["phases"][name]["self_s"] == stats.phase_time(name, exclusive=True)
+
+
+def test_record_only_collects_its_own_thread():
+    with record() as stats:
+        count("main")
+        worker = threading.Thread(target=count, args=("worker",))
+        worker.start()
+        worker.join()
+    assert stats.counters == {"main": 1}
+
+
+def test_nested_record_collects_separately():
+    with record() as outer:
+        count("a")
+        with record() as inner:
+            count("b")
+        count("a")
+    assert outer.counters == {"a": 2}
+    assert inner.counters == {"b": 1}